@@ -1,13 +1,19 @@
 import sys
 import os
+import argparse
 
 # Ensure src is in path
 sys.path.append(os.getcwd())
 
 from src.data import obtain, scrub
-from src.analysis import explore, model
+from src.analysis import explore, model, hex_grid, generate_map
 
 def main():
+    parser = argparse.ArgumentParser(description='Tashkent districts pipeline')
+    parser.add_argument('--hex-size', type=float, default=None,
+                        help='Also score a hexagonal grid over the city with cells of this size in metres')
+    args = parser.parse_args()
+
     print("=== Starting Project Pipeline ===")
     
     # 1. Obtain Data
@@ -33,6 +39,13 @@ def main():
     print("\n--- Step 4: Model Data ---")
     model.run_modelling()
     
+    # 5. Sub-district Grid Scoring (optional)
+    if args.hex_size is not None:
+        print("\n--- Step 5: Hexagonal Grid Scoring ---")
+        grid = hex_grid.run_grid_scoring(args.hex_size)
+        if grid is not None:
+            generate_map.generate_grid_map(grid)
+    
     print("\n=== Pipeline Complete ===")
 
 if __name__ == "__main__":
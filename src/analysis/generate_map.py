@@ -31,5 +31,32 @@ def generate_district_map():
     except Exception as e:
         print(f"Error generating map: {e}")
 
+def generate_grid_map(grid, output_path='plots/tashkent_grid_scores_map.png'):
+    # Cell-level choropleth of the hexagonal grid scores (see hex_grid.run_grid_scoring)
+    print("Generating Tashkent Grid Score Map...")
+    SHP_PATH = 'data/geo/Toshkent_chegara.shp'
+
+    if not os.path.exists('plots'):
+        os.makedirs('plots')
+
+    try:
+        districts = gpd.read_file(SHP_PATH).to_crs(grid.crs)
+
+        fig, ax = plt.subplots(figsize=(12, 10))
+        # No cell outlines: at tens of thousands of cells the edges would hide the fill
+        grid.plot(ax=ax, column='Composite_Score', cmap='RdYlGn', linewidth=0, legend=True,
+                  legend_kwds={'label': 'Composite Score (0-10)', 'shrink': 0.7})
+        districts.boundary.plot(ax=ax, linewidth=1, color='black')
+
+        plt.title('Tashkent Composite Score by Hexagonal Cell', fontsize=15)
+        ax.set_axis_off()
+        plt.tight_layout()
+        plt.savefig(output_path, dpi=300)
+        plt.close(fig)
+        print(f"Saved {output_path}")
+
+    except Exception as e:
+        print(f"Error generating grid map: {e}")
+
 if __name__ == "__main__":
     generate_district_map()
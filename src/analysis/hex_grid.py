@@ -0,0 +1,229 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import shapely
+
+from src.data.scrub import DISTRICT_NAME_MAP, normalize_features
+from src.analysis.model import compute_scores
+
+SHP_PATH = 'data/geo/Toshkent_chegara.shp'
+STATIONS_PATH = 'data/geo/export.geojson'
+POI_POINTS_PATH = 'data/raw/raw_poi_points.csv'
+# Optional geocoded listings (lat, lon, Rent_Price_USD). Cells without listings
+# fall back to the median rent of their district.
+LISTINGS_PATH = 'data/raw/raw_listings.csv'
+DISTRICT_DATA_PATH = 'data/processed/cleaned_district_data.csv'
+GRID_CACHE_DIR = 'data/processed'
+GRID_RANKINGS_PATH = 'final_grid_rankings.csv'
+
+# UTM zone 42N, so hex sizes and distances are in metres
+METRIC_CRS = 'EPSG:32642'
+DEFAULT_HEX_SIZE_M = 500
+
+SQRT3 = np.sqrt(3)
+# Axial offsets of a cell and its six neighbours
+NEIGHBOUR_OFFSETS = np.array([(0, 0), (1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)])
+
+# Hexes are "pointy-top" with hex_size_m as the centre-to-corner distance and
+# are addressed by axial (q, r) coordinates relative to the south-west corner
+# of the city boundary. See https://www.redblobgames.com/grids/hexagons/
+
+
+@lru_cache(maxsize=1)
+def _load_districts():
+    gdf = gpd.read_file(SHP_PATH).to_crs(METRIC_CRS)
+    gdf['District'] = gdf['tuman'].str.strip().map(lambda name: DISTRICT_NAME_MAP.get(name, name))
+    return gdf[['District', 'geometry']]
+
+
+def _grid_origin():
+    minx, miny, _, _ = _load_districts().total_bounds
+    return minx, miny
+
+
+def _axial_to_xy(q, r, hex_size_m):
+    origin_x, origin_y = _grid_origin()
+    x = origin_x + hex_size_m * SQRT3 * (q + r / 2)
+    y = origin_y + hex_size_m * 1.5 * r
+    return x, y
+
+
+def _xy_to_axial(x, y, hex_size_m):
+    # Vectorized binning: convert every point to fractional axial coordinates
+    # and round to the containing hex in one pass (cube-coordinate rounding)
+    origin_x, origin_y = _grid_origin()
+    x = (np.asarray(x, dtype=float) - origin_x) / hex_size_m
+    y = (np.asarray(y, dtype=float) - origin_y) / hex_size_m
+    q = SQRT3 / 3 * x - y / 3
+    r = 2 / 3 * y
+    s = -q - r
+
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+
+def _build_hex_grid(hex_size_m):
+    districts = _load_districts()
+    minx, miny, maxx, maxy = districts.total_bounds
+
+    # Cover the bounding box with axial coordinates, then keep hexes touching the city
+    r = np.arange(-1, int(np.ceil((maxy - miny) / (1.5 * hex_size_m))) + 2)
+    q = np.arange(-int(np.ceil(r.max() / 2)) - 1, int(np.ceil((maxx - minx) / (SQRT3 * hex_size_m))) + 2)
+    qq, rr = np.meshgrid(q, r)
+    qq, rr = qq.ravel(), rr.ravel()
+    cx, cy = _axial_to_xy(qq, rr, hex_size_m)
+    in_bbox = (cx >= minx - hex_size_m) & (cx <= maxx + hex_size_m)
+    qq, rr, cx, cy = qq[in_bbox], rr[in_bbox], cx[in_bbox], cy[in_bbox]
+
+    angles = np.deg2rad(30 + 60 * np.arange(6))
+    corners = np.stack([
+        cx[:, None] + hex_size_m * np.cos(angles),
+        cy[:, None] + hex_size_m * np.sin(angles),
+    ], axis=-1)
+    hexes = shapely.polygons(corners)
+
+    boundary = shapely.union_all(districts.geometry.values)
+    shapely.prepare(boundary)
+    in_city = shapely.intersects(boundary, hexes)
+
+    grid = gpd.GeoDataFrame({
+        'q': qq[in_city],
+        'r': rr[in_city],
+    }, geometry=hexes[in_city], crs=METRIC_CRS).reset_index(drop=True)
+
+    # Each cell belongs to the district containing (or nearest to) its centre
+    centres = gpd.GeoDataFrame(geometry=gpd.points_from_xy(cx[in_city], cy[in_city]), crs=METRIC_CRS)
+    nearest = gpd.sjoin_nearest(centres, districts, how='left')
+    nearest = nearest[~nearest.index.duplicated(keep='first')]
+    grid['District'] = nearest['District'].reindex(centres.index).values
+    grid.insert(0, 'cell_id', np.arange(len(grid)))
+    return grid
+
+
+@lru_cache(maxsize=8)
+def _cached_hex_grid(hex_size_m):
+    cache_path = os.path.join(GRID_CACHE_DIR, f'hex_grid_{hex_size_m:g}m.gpkg')
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(SHP_PATH):
+        print(f"Loading cached {cache_path}")
+        return gpd.read_file(cache_path)
+
+    print(f"Building {hex_size_m:g} m hexagonal grid...")
+    grid = _build_hex_grid(hex_size_m)
+
+    if not os.path.exists(GRID_CACHE_DIR):
+        os.makedirs(GRID_CACHE_DIR)
+    grid.to_file(cache_path, driver='GPKG')
+    print(f"Saved {cache_path}")
+    return grid
+
+
+def build_hex_grid(hex_size_m=DEFAULT_HEX_SIZE_M):
+    # Geometry is cached in memory and on disk per cell size; hand out a copy
+    # so feature columns added by callers don't leak into the cache
+    return _cached_hex_grid(float(hex_size_m)).copy()
+
+
+def _cell_positions(grid, q, r):
+    # Row of the grid for each (q, r), -1 where the point falls outside the city
+    cells = pd.MultiIndex.from_arrays([grid['q'].values, grid['r'].values])
+    return cells.get_indexer(pd.MultiIndex.from_arrays([q, r]))
+
+
+def _count_points(grid, x, y, hex_size_m, include_neighbours=False):
+    q, r = _xy_to_axial(x, y, hex_size_m)
+    if include_neighbours:
+        q = (q[:, None] + NEIGHBOUR_OFFSETS[:, 0]).ravel()
+        r = (r[:, None] + NEIGHBOUR_OFFSETS[:, 1]).ravel()
+    pos = _cell_positions(grid, q, r)
+    return np.bincount(pos[pos >= 0], minlength=len(grid))
+
+
+def _median_per_cell(grid, x, y, values, hex_size_m):
+    q, r = _xy_to_axial(x, y, hex_size_m)
+    pos = _cell_positions(grid, q, r)
+    valid = pos >= 0
+    medians = pd.Series(np.asarray(values, dtype=float)[valid]).groupby(pos[valid]).median()
+    return medians.reindex(np.arange(len(grid))).values
+
+
+def _project_lon_lat(df):
+    points = gpd.GeoSeries.from_xy(df['lon'], df['lat'], crs='EPSG:4326').to_crs(METRIC_CRS)
+    return points.x.values, points.y.values
+
+
+def _load_stations():
+    stations = gpd.read_file(STATIONS_PATH)
+    stations = stations[stations.geometry.geom_type == 'Point'].to_crs(METRIC_CRS)
+    return stations.geometry.x.values, stations.geometry.y.values
+
+
+def _load_csv(path):
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path).dropna(subset=['lat', 'lon'])
+
+
+def run_grid_scoring(hex_size_m=DEFAULT_HEX_SIZE_M):
+    print(f"Running Hexagonal Grid Scoring ({hex_size_m:g} m cells)...")
+    try:
+        district_df = pd.read_csv(DISTRICT_DATA_PATH)
+    except FileNotFoundError:
+        print("Cleaned data not found.")
+        return None
+
+    grid = build_hex_grid(hex_size_m)
+    print(f"Grid has {len(grid)} cells.")
+
+    # Transport: metro stations in the cell or one of its neighbours, so a cell
+    # next to a station is not scored as having no metro access
+    station_x, station_y = _load_stations()
+    grid['Transport_Score'] = _count_points(grid, station_x, station_y, hex_size_m, include_neighbours=True)
+
+    pois = _load_csv(POI_POINTS_PATH)
+    if pois is None:
+        print(f"{POI_POINTS_PATH} not found, job and POI counts set to 0.")
+        pois = pd.DataFrame(columns=['Category', 'lat', 'lon'])
+    for category, col in [('office', 'Tech_Jobs_Count'), ('cultural', 'Cultural_POI_Count')]:
+        poi_x, poi_y = _project_lon_lat(pois[pois['Category'] == category])
+        grid[col] = _count_points(grid, poi_x, poi_y, hex_size_m)
+
+    # Rent: median of geocoded listings per cell, else the district median
+    district_rent = grid['District'].map(district_df.set_index('District')['Rent_Price_USD'])
+    listings = _load_csv(LISTINGS_PATH)
+    if listings is not None and len(listings) > 0:
+        listing_x, listing_y = _project_lon_lat(listings)
+        cell_rent = _median_per_cell(grid, listing_x, listing_y, listings['Rent_Price_USD'], hex_size_m)
+        grid['Rent_Price_USD'] = pd.Series(cell_rent, index=grid.index).fillna(district_rent)
+    else:
+        print(f"{LISTINGS_PATH} not found, using district median rent per cell.")
+        grid['Rent_Price_USD'] = district_rent
+    grid['Rent_Price_USD'] = grid['Rent_Price_USD'].fillna(district_df['Rent_Price_USD'].median())
+
+    normalize_features(grid)
+    grid = compute_scores(grid)
+
+    # Cell centres in lat/lon so recommendations can be located on a map
+    centres = grid.geometry.centroid.to_crs('EPSG:4326')
+    grid['lat'] = centres.y.values
+    grid['lon'] = centres.x.values
+
+    ranked = grid.sort_values('Composite_Score', ascending=False)
+    print("\nTop 5 Recommended Cells:")
+    print(ranked[['cell_id', 'District', 'Composite_Score', 'Rent_Price_USD', 'lat', 'lon']].head(5))
+
+    ranked.drop(columns='geometry').to_csv(GRID_RANKINGS_PATH, index=False)
+    print(f"\nSaved {GRID_RANKINGS_PATH}")
+    print("Grid scoring complete.")
+    return grid
+
+
+if __name__ == "__main__":
+    run_grid_scoring()
@@ -2,6 +2,30 @@ import pandas as pd
 import numpy as np
 import statsmodels.api as sm
 
+# Shared by the district ranking and the hexagonal grid scoring (hex_grid.py)
+def compute_scores(df):
+    # We have normalized values (0-1). Multiply by 10 to get 0-10 score.
+    # Factors:
+    # - Transport Score (Higher is better)
+    # - Job Availability (Higher is better)
+    # - Cultural POIs (Higher is better)
+    # - Rent Affordability (Higher is better, we created Rent_Affordability_Norm)
+    
+    df['Score_Transport'] = df['Transport_Score_Norm'] * 10
+    df['Score_Jobs'] = df['Tech_Jobs_Count_Norm'] * 10
+    df['Score_POI'] = df['Cultural_POI_Count_Norm'] * 10
+    df['Score_Rent'] = df['Rent_Affordability_Norm'] * 10
+    
+    # Simple weighted average (Equal weights for now)
+    df['Composite_Score'] = (
+        df['Score_Transport'] + 
+        df['Score_Jobs'] + 
+        df['Score_POI'] + 
+        df['Score_Rent']
+    ) / 4
+
+    return df
+
 def run_modelling():
     print("Running Modelling Phase...")
     try:
@@ -28,25 +52,7 @@ def run_modelling():
     # 2. Scoring System (0-10)
     print("\n--- Calculating Composite Scores ---")
     
-    # We have normalized values (0-1). Multiply by 10 to get 0-10 score.
-    # Factors:
-    # - Transport Score (Higher is better)
-    # - Job Availability (Higher is better)
-    # - Cultural POIs (Higher is better)
-    # - Rent Affordability (Higher is better, we created Rent_Affordability_Norm)
-    
-    df['Score_Transport'] = df['Transport_Score_Norm'] * 10
-    df['Score_Jobs'] = df['Tech_Jobs_Count_Norm'] * 10
-    df['Score_POI'] = df['Cultural_POI_Count_Norm'] * 10
-    df['Score_Rent'] = df['Rent_Affordability_Norm'] * 10
-    
-    # Simple weighted average (Equal weights for now)
-    df['Composite_Score'] = (
-        df['Score_Transport'] + 
-        df['Score_Jobs'] + 
-        df['Score_POI'] + 
-        df['Score_Rent']
-    ) / 4
+    df = compute_scores(df)
     
     # Sort by Composite Score
     ranked_df = df.sort_values('Composite_Score', ascending=False)
@@ -230,11 +230,52 @@ def get_poi_data():
             
     return pd.DataFrame(data)
 
+def get_poi_points():
+    print("Fetching OSM POI Coordinates for Grid Scoring (Overpass API)...")
+
+    RAW_POI_POINTS_PATH = 'data/raw/raw_poi_points.csv'
+    if os.path.exists(RAW_POI_POINTS_PATH):
+        print(f"Loading cached {RAW_POI_POINTS_PATH}")
+        return pd.read_csv(RAW_POI_POINTS_PATH)
+
+    # Bounding box around Toshkent_chegara.shp (south, west, north, east)
+    bbox = "41.16,69.12,41.43,69.48"
+    headers = {'User-Agent': 'TashkentDataScienceProject/1.0'}
+    overpass_url = "http://overpass-api.de/api/interpreter"
+    # Same tags as the per-district counts: 'office' for jobs, cultural amenities for POIs
+    query = (
+        f"[out:json][timeout:90];"
+        f"(nwr['office']({bbox});"
+        f"nwr['amenity'~'cafe|theatre|arts_centre|cinema|library']({bbox}););"
+        f"out center;"
+    )
+
+    data = []
+    for attempt in range(2):
+        try:
+            resp = requests.get(overpass_url, params={'data': query}, headers=headers, timeout=120)
+            if resp.status_code == 200:
+                for element in resp.json().get('elements', []):
+                    # Ways and relations carry their coordinates in 'center'
+                    point = element if 'lat' in element else element.get('center')
+                    if not point:
+                        continue
+                    category = 'office' if 'office' in element.get('tags', {}) else 'cultural'
+                    data.append({'Category': category, 'lat': point['lat'], 'lon': point['lon']})
+                break
+        except Exception as e:
+            print(f"  Error fetching POI coordinates: {e}")
+            time.sleep(2)
+
+    print(f"  Found {len(data)} POIs with coordinates.")
+    return pd.DataFrame(data, columns=['Category', 'lat', 'lon'])
+
 def main():
     df_metro = get_metro_data()
     df_rent = get_rent_data()
     df_jobs = get_job_data()
     df_poi = get_poi_data()
+    df_poi_points = get_poi_points()
     
     # Ensure data/raw directory exists
     if not os.path.exists('data/raw'):
@@ -245,6 +286,7 @@ def main():
     df_rent.to_csv('data/raw/raw_rent.csv', index=False)
     df_jobs.to_csv('data/raw/raw_jobs.csv', index=False)
     df_poi.to_csv('data/raw/raw_pois.csv', index=False)
+    df_poi_points.to_csv('data/raw/raw_poi_points.csv', index=False)
     print("Obtain phase complete.")
 
 if __name__ == "__main__":
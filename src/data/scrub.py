@@ -1,6 +1,25 @@
 import pandas as pd
 import numpy as np
 
+# Cyrillic district names (as used in Toshkent_chegara.shp and the transport CSV)
+# mapped to the Latin names used by the other datasets
+DISTRICT_NAME_MAP = {
+    'Бектемир': 'Bektemir',
+    'Чилонзор': 'Chilanzar',
+    'Яшнобод': 'Yashnobod',
+    'Яккасарой': 'Yakkasaray',
+    'Мирзо Улуғбек': 'Mirzo Ulugbek',
+    'Миробод': 'Mirabad',
+    'Шайҳонтохур': 'Shaykhantakhur',
+    'Олмазор': 'Almazar',
+    'Учтепа': 'Uchtepa',
+    'Сергели': 'Sergeli',
+    'Юнусобод': 'Yunusabad',
+    'Янгиҳаёт': 'Yangihayot' # Note: Yangihayot might not be in our mock lists, but good to handle
+}
+
+NUMERIC_COLS = ['Transport_Score', 'Rent_Price_USD', 'Tech_Jobs_Count', 'Cultural_POI_Count']
+
 def load_data():
     print("Loading raw datasets...")
     try:
@@ -17,29 +36,42 @@ def load_data():
         return None, None, None, None
 
 
+# Shared by the district pipeline and the hexagonal grid scoring (analysis/hex_grid.py)
+# so both produce the *_Norm columns that model.compute_scores expects
+def normalize_features(df):
+    # Normalization (Min-Max Scaling) for later scoring
+    # We will keep original values for display, and create new normalized columns for modelling
+    print("Normalizing data for analysis...")
+    for col in NUMERIC_COLS:
+        min_val = df[col].min()
+        max_val = df[col].max()
+        if max_val - min_val != 0:
+            df[f'{col}_Norm'] = (df[col] - min_val) / (max_val - min_val)
+        else:
+            df[f'{col}_Norm'] = 0.0
+            
+    # For Rent, lower is better, so we might want to invert the normalized score in the modelling phase,
+    # or create a 'Rent_Score' here where 1 is best (cheapest) and 0 is worst (most expensive).
+    # Let's create 'Rent_Affordability' where 1 = cheapest.
+    # Formula: (Max - Value) / (Max - Min)
+    min_rent = df['Rent_Price_USD'].min()
+    max_rent = df['Rent_Price_USD'].max()
+    if max_rent - min_rent != 0:
+        df['Rent_Affordability_Norm'] = (max_rent - df['Rent_Price_USD']) / (max_rent - min_rent)
+    else:
+        df['Rent_Affordability_Norm'] = 0.5 # Neutral if all same
+
+    return df
+
+
 def clean_and_merge(transport, rent, jobs, pois):
     print("Cleaning and Merging Data...")
     
     # Transport data might be in Cyrillic if it came from the CSV
     # Map Cyrillic to Latin to match other datasets
-    name_map = {
-        'Бектемир': 'Bektemir',
-        'Чилонзор': 'Chilanzar',
-        'Яшнобод': 'Yashnobod',
-        'Яккасарой': 'Yakkasaray',
-        'Мирзо Улуғбек': 'Mirzo Ulugbek',
-        'Миробод': 'Mirabad',
-        'Шайҳонтохур': 'Shaykhantakhur',
-        'Олмазор': 'Almazar',
-        'Учтепа': 'Uchtepa',
-        'Сергели': 'Sergeli',
-        'Юнусобод': 'Yunusabad',
-        'Янгиҳаёт': 'Yangihayot' # Note: Yangihayot might not be in our mock lists, but good to handle
-    }
-    
     # helper to clean names
     def clean_name(name):
-        return name_map.get(str(name).strip(), str(name).strip())
+        return DISTRICT_NAME_MAP.get(str(name).strip(), str(name).strip())
 
     if 'District' in transport.columns:
          transport['District'] = transport['District'].apply(clean_name)
@@ -57,8 +89,7 @@ def clean_and_merge(transport, rent, jobs, pois):
     # Handle Missing Values
     print("Handling missing values...")
     # Fill numeric columns with median or 0
-    numeric_cols = ['Transport_Score', 'Rent_Price_USD', 'Tech_Jobs_Count', 'Cultural_POI_Count']
-    for col in numeric_cols:
+    for col in NUMERIC_COLS:
         if col in df.columns:
             # Treating 0 as missing for Jobs/Rent/POI because 0 is unlikely in these large districts
             # BUT Transport_Score 0 might be real (no metro).
@@ -71,27 +102,7 @@ def clean_and_merge(transport, rent, jobs, pois):
             df[col] = df[col].fillna(median_val)
             print(f"Filled missing/zero (if applicable) {col} with {median_val}")
 
-    # Normalization (Min-Max Scaling) for later scoring
-    # We will keep original values for display, and create new normalized columns for modelling
-    print("Normalizing data for analysis...")
-    for col in numeric_cols:
-        min_val = df[col].min()
-        max_val = df[col].max()
-        if max_val - min_val != 0:
-            df[f'{col}_Norm'] = (df[col] - min_val) / (max_val - min_val)
-        else:
-            df[f'{col}_Norm'] = 0.0
-            
-    # For Rent, lower is better, so we might want to invert the normalized score in the modelling phase,
-    # or create a 'Rent_Score' here where 1 is best (cheapest) and 0 is worst (most expensive).
-    # Let's create 'Rent_Affordability' where 1 = cheapest.
-    # Formula: (Max - Value) / (Max - Min)
-    min_rent = df['Rent_Price_USD'].min()
-    max_rent = df['Rent_Price_USD'].max()
-    if max_rent - min_rent != 0:
-        df['Rent_Affordability_Norm'] = (max_rent - df['Rent_Price_USD']) / (max_rent - min_rent)
-    else:
-        df['Rent_Affordability_Norm'] = 0.5 # Neutral if all same
+    normalize_features(df)
         
     return df
 